@@ -7,7 +7,9 @@ Designed for 17 MAC/ICCO centres
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-from center_database_v2 import render_center_database
+
+# center_database_v2 (and its pandas/numpy machinery) is imported lazily on
+# the Center Database page so the other pages don't pay for it at startup.
 
 # ============================================================================
 # PAGE CONFIGURATION & THEME
@@ -19,8 +21,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
+# Custom CSS for better styling. Built once at import; it must be emitted on
+# every run, because Streamlit drops any element not re-emitted during the
+# current script run (a once-per-session gate loses the styles on rerun).
+_CUSTOM_CSS = """
     <style>
     .main-header {
         font-size: 2.5rem;
@@ -42,7 +46,9 @@ st.markdown("""
         color: white;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
 
 # ============================================================================
 # SIDEBAR NAVIGATION
@@ -76,144 +82,157 @@ if st.sidebar.button("🔄 Refresh Data"):
     st.success("✅ Data refreshed!")
 
 # ============================================================================
-# PAGE 1: MAIN
+# PAGE 1: MAIN (static content, built once at import time)
 # ============================================================================
-if page == "🏠 Main":
+
+_MAIN_OVERVIEW_MD = """
+### 🎯 Platform Overview
+
+Comprehensive dashboard suite for MAC (Muslim Association of Canada) and ICCO (Islamic Community 
+Centre of Ontario) to track programs, activities, and centre engagement across 17 locations.
+
+#### ✨ Key Features
+
+- **📊 Programs Database Analytics** - Track all programs across 17 centres
+- **👥 Participant Tracking** - Monitor engagement and participation
+- **🎯 Target Audience Analysis** - Segment programs by audience groups
+- **📈 Performance Metrics** - KPIs and trend analysis
+- **📥 Easy Data Upload** - Upload Excel files for instant analytics
+- **☁️ Cloud Deployment** - Hosted on Streamlit Cloud
+
+#### 📑 Available Dashboards
+
+1. **🏛️ Center Database** ← **START HERE** - Full programs analytics by centre
+2. **📈 All Centers Summary** - Aggregate view across all 17 centres
+3. **🌙 All Ramadan Summary** - Ramadan campaign tracking
+4. **📚 Ramadan Database** - Detailed Ramadan analytics
+5. **🎯 OKR & Strategic Alignment** - Strategic objectives tracking
+
+#### 🚀 Quick Start (2 Minutes)
+
+1. **Click** 🏛️ Center Database in the sidebar
+2. **Select** your centre from the dropdown
+3. **View** all programs, participants, and analytics
+4. **Export** data as CSV for reports
+
+#### 📊 What You Can See
+
+- **Program Distribution** - Most common programs
+- **Participant Trends** - Participation over time
+- **Target Audiences** - Who programs are for
+- **Satisfaction Scores** - Program quality ratings
+- **Raw Data** - Full details with filtering
+
+#### 💾 Upload Your Data
+
+Go to Center Database → Upload tab to add/update your programs database.
+"""
+
+_MAIN_SYSTEM_INFO_MD = """
+### 📌 System Info
+
+- **Total Centers:** 17 MAC/ICCO
+- **Data Source:** Excel files
+- **Update Mode:** Real-time upload
+- **Version:** 2.0.0
+
+### 🎯 Supported Centres
+
+- ICCO (Main)
+- Mississauga
+- Toronto
+- Brampton
+- Ajax
+- Markham
+- Richmond Hill
+- Scarborough
+- Etobicoke
+- North York
+- Vaughan
+- Oshawa
+- Hamilton
+- Oakville
+- Burlington
+- Milton
+- Guelph
+
+### 💡 Pro Tips
+
+✓ Use centre dropdown to filter  
+✓ Use filters to refine data  
+✓ Download CSV for Excel  
+✓ Refresh data when updated  
+✓ Check raw data tab for details
+"""
+
+_MAIN_FEATURE_CARDS_MD = (
+    """
+### 🏛️ Centre Database
+
+Complete programs analytics for each centre with:
+- Program distribution
+- Participant numbers
+- Target audience breakdown
+- Satisfaction ratings
+""",
+    """
+### 📈 National View
+
+Aggregate analytics across all centres:
+- Top programs nationally
+- Total participants
+- Most served audiences
+- Trend analysis
+""",
+    """
+### 🌙 Ramadan Focus
+
+Dedicated Ramadan tracking:
+- Campaign performance
+- Donor analytics
+- Event attendance
+- Impact metrics
+""",
+)
+
+_MAIN_GETTING_STARTED_MD = """
+### 📖 Getting Started
+
+**Step 1:** Click **🏛️ Center Database** in sidebar  
+**Step 2:** Select your centre name from dropdown  
+**Step 3:** View interactive charts and analytics  
+**Step 4:** Use Raw Data tab to filter and export  
+
+**For support:** Check README.md in project files
+"""
+
+
+@st.fragment
+def _render_main_page():
+    """Main page body: all static markdown, isolated from other pages' reruns"""
     st.markdown('<div class="main-header">📊 MAC Stakeholder Dashboards</div>', unsafe_allow_html=True)
-    
+
     col1, col2 = st.columns([2, 1])
-    
+
     with col1:
-        st.markdown("""
-        ### 🎯 Platform Overview
-        
-        Comprehensive dashboard suite for MAC (Muslim Association of Canada) and ICCO (Islamic Community 
-        Centre of Ontario) to track programs, activities, and centre engagement across 17 locations.
-        
-        #### ✨ Key Features
-        
-        - **📊 Programs Database Analytics** - Track all programs across 17 centres
-        - **👥 Participant Tracking** - Monitor engagement and participation
-        - **🎯 Target Audience Analysis** - Segment programs by audience groups
-        - **📈 Performance Metrics** - KPIs and trend analysis
-        - **📥 Easy Data Upload** - Upload Excel files for instant analytics
-        - **☁️ Cloud Deployment** - Hosted on Streamlit Cloud
-        
-        #### 📑 Available Dashboards
-        
-        1. **🏛️ Center Database** ← **START HERE** - Full programs analytics by centre
-        2. **📈 All Centers Summary** - Aggregate view across all 17 centres
-        3. **🌙 All Ramadan Summary** - Ramadan campaign tracking
-        4. **📚 Ramadan Database** - Detailed Ramadan analytics
-        5. **🎯 OKR & Strategic Alignment** - Strategic objectives tracking
-        
-        #### 🚀 Quick Start (2 Minutes)
-        
-        1. **Click** 🏛️ Center Database in the sidebar
-        2. **Select** your centre from the dropdown
-        3. **View** all programs, participants, and analytics
-        4. **Export** data as CSV for reports
-        
-        #### 📊 What You Can See
-        
-        - **Program Distribution** - Most common programs
-        - **Participant Trends** - Participation over time
-        - **Target Audiences** - Who programs are for
-        - **Satisfaction Scores** - Program quality ratings
-        - **Raw Data** - Full details with filtering
-        
-        #### 💾 Upload Your Data
-        
-        Go to Center Database → Upload tab to add/update your programs database.
-        """)
-    
+        st.markdown(_MAIN_OVERVIEW_MD)
+
     with col2:
-        st.info("""
-        ### 📌 System Info
-        
-        - **Total Centers:** 17 MAC/ICCO
-        - **Data Source:** Excel files
-        - **Update Mode:** Real-time upload
-        - **Version:** 2.0.0
-        
-        ### 🎯 Supported Centres
-        
-        - ICCO (Main)
-        - Mississauga
-        - Toronto
-        - Brampton
-        - Ajax
-        - Markham
-        - Richmond Hill
-        - Scarborough
-        - Etobicoke
-        - North York
-        - Vaughan
-        - Oshawa
-        - Hamilton
-        - Oakville
-        - Burlington
-        - Milton
-        - Guelph
-        
-        ### 💡 Pro Tips
-        
-        ✓ Use centre dropdown to filter  
-        ✓ Use filters to refine data  
-        ✓ Download CSV for Excel  
-        ✓ Refresh data when updated  
-        ✓ Check raw data tab for details
-        """)
-    
+        st.info(_MAIN_SYSTEM_INFO_MD)
+
     st.markdown("---")
-    
+
     # Features showcase
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        ### 🏛️ Centre Database
-        
-        Complete programs analytics for each centre with:
-        - Program distribution
-        - Participant numbers
-        - Target audience breakdown
-        - Satisfaction ratings
-        """)
-    
-    with col2:
-        st.markdown("""
-        ### 📈 National View
-        
-        Aggregate analytics across all centres:
-        - Top programs nationally
-        - Total participants
-        - Most served audiences
-        - Trend analysis
-        """)
-    
-    with col3:
-        st.markdown("""
-        ### 🌙 Ramadan Focus
-        
-        Dedicated Ramadan tracking:
-        - Campaign performance
-        - Donor analytics
-        - Event attendance
-        - Impact metrics
-        """)
-    
+    for col, card in zip(st.columns(3), _MAIN_FEATURE_CARDS_MD):
+        with col:
+            st.markdown(card)
+
     st.markdown("---")
-    st.markdown("""
-    ### 📖 Getting Started
-    
-    **Step 1:** Click **🏛️ Center Database** in sidebar  
-    **Step 2:** Select your centre name from dropdown  
-    **Step 3:** View interactive charts and analytics  
-    **Step 4:** Use Raw Data tab to filter and export  
-    
-    **For support:** Check README.md in project files
-    """)
+    st.markdown(_MAIN_GETTING_STARTED_MD)
+
+
+if page == "🏠 Main":
+    _render_main_page()
 
 # ============================================================================
 # PAGE 2: ALL CENTERS SUMMARY
@@ -246,6 +265,8 @@ elif page == "📈 All Centers Summary":
 # PAGE 3: CENTER DATABASE (FUNCTIONAL)
 # ============================================================================
 elif page == "🏛️ Center Database":
+    from center_database_v2 import render_center_database
+
     render_center_database()
 
 # ============================================================================
@@ -3,88 +3,286 @@ ADVANCED CENTER DATABASE MODULE
 Ready to integrate with real Excel data
 """
 
+from __future__ import annotations
+
+import os
+
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime
 import numpy as np
 
+# plotly is imported inside the chart builders: its ~100-300ms import only
+# runs when a chart is actually drawn, not on every app startup.
+
 # ============================================================================
 # SAMPLE DATA GENERATOR (Replace with your Excel loader)
 # ============================================================================
 
+# String columns stored as category dtype: groupby/isin/unique then operate
+# on integer codes instead of hashing Python strings, and memory drops ~5-10x.
+_CATEGORICAL_COLS = ('Program', 'Category', 'Notes')
+
+# The value ranges all fit in small types; 8 bytes/value int64/float64
+# defaults waste cache on every groupby and reduction.
+_NUMERIC_DTYPES = {
+    'Participants': 'int32',
+    'Satisfaction': 'int8',
+    'Feedback_Score': 'int8',
+    'Attendance_Rate': 'float32',
+}
+
+
+def _normalize_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast the known string columns to category dtype, downcast the numeric
+    columns, and guarantee Date is datetime64 (in place), so downstream code
+    never re-parses or re-converts.
+    """
+    for col in _CATEGORICAL_COLS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    for col, dtype in _NUMERIC_DTYPES.items():
+        if col in df.columns and df[col].dtype != dtype:
+            try:
+                df[col] = df[col].astype(dtype)
+            except (TypeError, ValueError):
+                pass  # leave unexpected upload dtypes as-is
+    if 'Date' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['Date']):
+        df['Date'] = pd.to_datetime(df['Date'])
+    return df
+
+
+@st.cache_data(show_spinner=False)
 def generate_sample_center_data(center_name: str) -> pd.DataFrame:
     """
     Generate sample data for demonstration.
     Replace this with your actual Excel file loader.
     """
-    np.random.seed(42)
+    # Local generator instead of reseeding the legacy global RNG; the cache
+    # above means this body only runs once per centre per session anyway.
+    rng = np.random.default_rng(42)
     dates = pd.date_range(start='2024-01-01', end='2024-12-31', freq='D')
-    
+
     programs = ['Islamic Studies', 'Youth Program', 'Community Service', 'Women Empowerment', 'Quran Classes']
     categories = ['Engagement', 'Learning', 'Community', 'Feedback', 'Growth']
-    
+
     data = {
-        'Date': np.random.choice(dates, 500),
-        'Program': np.random.choice(programs, 500),
-        'Participants': np.random.randint(5, 100, 500),
-        'Satisfaction': np.random.randint(1, 6, 500),  # 1-5 scale
-        'Category': np.random.choice(categories, 500),
-        'Attendance_Rate': np.random.uniform(0.6, 1.0, 500),
-        'Feedback_Score': np.random.randint(1, 10, 500),
+        'Date': rng.choice(dates, 500),
+        'Program': rng.choice(programs, 500),
+        'Participants': rng.integers(5, 100, 500),
+        'Satisfaction': rng.integers(1, 6, 500),  # 1-5 scale
+        'Category': rng.choice(categories, 500),
+        'Attendance_Rate': rng.uniform(0.6, 1.0, 500),
+        'Feedback_Score': rng.integers(1, 10, 500),
         'Notes': ['Good engagement', 'High participation', 'Good feedback', 'Excellent turnout', 'Need improvement'] * 100
     }
     
-    return pd.DataFrame(data).sort_values('Date')
+    return _normalize_dtypes(pd.DataFrame(data).sort_values('Date'))
 
 
-def load_center_data(center_name: str) -> pd.DataFrame:
+# Read hints: skip dtype inference and any columns the dashboard never uses
+_EXCEL_USECOLS = frozenset([
+    'Date', 'Program', 'Participants', 'Satisfaction',
+    'Category', 'Attendance_Rate', 'Feedback_Score', 'Notes',
+])
+
+
+def _read_excel_hinted(source) -> pd.DataFrame:
+    """
+    Parse an Excel source with column hints.
+    Prefers the fast calamine engine when python-calamine is installed.
+    No dtype hints: a blank or non-numeric cell would make the parse raise
+    outright, while _normalize_dtypes downcasts defensively after the read.
+    """
+    kwargs = dict(
+        usecols=lambda c: c in _EXCEL_USECOLS,
+        parse_dates=['Date'],
+    )
+    try:
+        return pd.read_excel(source, engine='calamine', **kwargs)
+    except ImportError:
+        return pd.read_excel(source, **kwargs)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _read_center_excel(file_path: str, file_mtime: float) -> pd.DataFrame:
     """
-    Load center data from Excel file.
-    Update path to your actual data location.
+    Cached load. file_mtime is part of the cache key so edits invalidate.
+
+    The first parse of an xlsx also writes a Parquet mirror next to it;
+    while the mirror is at least as new as the xlsx, later loads read the
+    (10-50x faster) columnar file instead of re-parsing Excel.
     """
+    parquet_path = os.path.splitext(file_path)[0] + '.parquet'
+    try:
+        if os.path.getmtime(parquet_path) >= file_mtime:
+            return _normalize_dtypes(pd.read_parquet(parquet_path))
+    except OSError:
+        pass
+
+    df = _normalize_dtypes(_read_excel_hinted(file_path))
+    try:
+        df.to_parquet(parquet_path)
+    except (ImportError, OSError):
+        pass  # the mirror is only an optimization; the Excel parse stands alone
+    return df
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _read_center_parquet(parquet_path: str, file_mtime: float) -> pd.DataFrame:
+    """Cached Parquet load for data persisted by the upload tab."""
+    return _normalize_dtypes(pd.read_parquet(parquet_path))
+
+
+def _mtime_or_none(path: str):
+    """File mtime, or None when the file does not exist."""
     try:
-        # Try to load from Excel
-        file_path = f"data/center_data/{center_name}.xlsx"
-        df = pd.read_excel(file_path)
-        return df
-    except FileNotFoundError:
-        # Return sample data if file not found
-        st.warning(f"Excel file for {center_name} not found. Using sample data for demo.")
-        return generate_sample_center_data(center_name)
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def _upload_parquet_path(center_name: str) -> str:
+    """Where the upload tab persists confirmed data for a centre. Distinct
+    from the xlsx's Parquet mirror so neither can clobber the other."""
+    return f"data/center_data/{center_name}.upload.parquet"
+
+
+def load_center_data(center_name: str) -> pd.DataFrame:
+    """
+    Load center data. A Parquet file confirmed in the upload tab wins while
+    it is at least as new as the centre's xlsx; otherwise the xlsx (via its
+    mirror), then sample data. Each cached read is keyed on its own file's
+    mtime, so a fresh upload is picked up immediately.
+    """
+    file_path = f"data/center_data/{center_name}.xlsx"
+    upload_path = _upload_parquet_path(center_name)
+
+    xlsx_mtime = _mtime_or_none(file_path)
+    upload_mtime = _mtime_or_none(upload_path)
+
+    if upload_mtime is not None and (xlsx_mtime is None or upload_mtime >= xlsx_mtime):
+        return _read_center_parquet(upload_path, upload_mtime)
+    if xlsx_mtime is not None:
+        return _read_center_excel(file_path, xlsx_mtime)
+
+    # Return sample data if no file found at all
+    st.warning(f"Excel file for {center_name} not found. Using sample data for demo.")
+    return generate_sample_center_data(center_name)
 
 
 # ============================================================================
 # ANALYSIS FUNCTIONS
 # ============================================================================
 
+def _df_cache_key(d: pd.DataFrame) -> tuple:
+    """
+    Cheap DataFrame hash for st.cache_data. Streamlit's default hashing
+    serializes every cell; one vectorized hash_pandas_object pass summed to
+    a single int is a fraction of that cost and still content-based, so two
+    frames with the same shape but different rows get distinct keys.
+    """
+    return (len(d), tuple(d.columns),
+            pd.util.hash_pandas_object(d, index=False).sum())
+
+
+_DF_HASH_FUNCS = {pd.DataFrame: _df_cache_key}
+
+
+def _most_frequent(col: pd.Series) -> str:
+    """
+    Most frequent label of a categorical column. bincount over the integer
+    codes is O(N) with no sorted frequency table, unlike
+    value_counts().idxmax().
+    """
+    codes = col.cat.codes.to_numpy()
+    codes = codes[codes >= 0]  # drop NaN code (-1)
+    if codes.size == 0:
+        return 'N/A'
+    return col.cat.categories[np.bincount(codes).argmax()]
+
+
 def calculate_metrics(df: pd.DataFrame) -> dict:
     """Calculate key metrics from center data"""
+    # Fused reductions: one .agg call instead of three separate column scans
+    stats = df.agg({
+        'Participants': 'sum',
+        'Satisfaction': 'mean',
+        'Attendance_Rate': 'mean',
+    })
     metrics = {
         'total_responses': len(df),
-        'total_participants': df['Participants'].sum(),
-        'avg_satisfaction': df['Satisfaction'].mean(),
-        'avg_attendance': df['Attendance_Rate'].mean() * 100,
-        'top_program': df['Program'].value_counts().idxmax() if len(df) > 0 else 'N/A',
-        'top_category': df['Category'].value_counts().idxmax() if len(df) > 0 else 'N/A',
+        'total_participants': int(stats['Participants']),
+        'avg_satisfaction': stats['Satisfaction'],
+        'avg_attendance': stats['Attendance_Rate'] * 100,
+        'top_program': _most_frequent(df['Program']),
+        'top_category': _most_frequent(df['Category']),
     }
     return metrics
 
 
-def create_satisfaction_chart(df: pd.DataFrame) -> go.Figure:
-    """Create satisfaction distribution chart"""
-    satisfaction_counts = df['Satisfaction'].value_counts().sort_index()
-    
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH_FUNCS)
+def compute_aggregates(df: pd.DataFrame) -> dict:
+    """
+    Compute every derived table the dashboard needs in one cached call.
+    Chart builders receive these precomputed tables instead of each
+    re-scanning the full frame on every render.
+    """
+    # Date is guaranteed datetime64 by the loader; no re-parse needed here
+    months = df['Date'].values.astype('datetime64[M]')
+    weeks = df['Date'].values.astype('datetime64[W]')
+
+    monthly = df.groupby(months).agg({
+        'Participants': 'sum',
+        'Satisfaction': 'mean'
+    })
+    monthly.index.name = 'Month'
+    monthly = monthly.reset_index()
+    monthly['Month'] = monthly['Month'].values.astype('datetime64[M]').astype(str)
+
+    weekly = df.groupby(weeks).agg({
+        'Participants': 'sum',
+        'Satisfaction': 'mean'
+    })
+    weekly.index.name = 'Week'
+    weekly = weekly.reset_index()
+    weekly['Week'] = weekly['Week'].values.astype('datetime64[W]').astype(str)
+
+    return {
+        'metrics': calculate_metrics(df),
+        'sat_counts': df['Satisfaction'].value_counts().sort_index(),
+        'program_agg': df.groupby('Program').agg({
+            'Participants': 'sum',
+            'Satisfaction': 'mean',
+            'Attendance_Rate': 'mean'
+        }),
+        'category_agg': df.groupby('Category').agg({
+            'Satisfaction': 'mean',
+            'Feedback_Score': 'mean'
+        }),
+        'category_counts': df['Category'].value_counts(),
+        'monthly': monthly,
+        'weekly': weekly,
+    }
+
+
+@st.cache_data(show_spinner=False)
+def create_satisfaction_chart(satisfaction_counts: pd.Series):
+    """Create satisfaction distribution chart from precomputed counts"""
+    import plotly.graph_objects as go
+    # One reindex fills the gaps in the 1-5 scale; reused for bars and labels
+    counts = satisfaction_counts.reindex(range(1, 6), fill_value=0).to_numpy()
+
     fig = go.Figure(data=[
         go.Bar(
             x=['Very Poor', 'Poor', 'Neutral', 'Good', 'Excellent'],
-            y=[satisfaction_counts.get(i, 0) for i in range(1, 6)],
+            y=counts,
             marker=dict(
                 color=['#ff6b6b', '#ffa726', '#ffd93d', '#6bcf7f', '#4ecdc4'],
                 line=dict(color='rgba(0,0,0,0.1)', width=1)
             ),
-            text=[satisfaction_counts.get(i, 0) for i in range(1, 6)],
+            text=counts,
             textposition='outside',
         )
     ])
@@ -100,13 +298,12 @@ def create_satisfaction_chart(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
-def create_program_engagement_chart(df: pd.DataFrame) -> go.Figure:
-    """Create program engagement chart"""
-    program_data = df.groupby('Program').agg({
-        'Participants': 'sum',
-        'Satisfaction': 'mean'
-    }).reset_index()
-    
+@st.cache_data(show_spinner=False)
+def create_program_engagement_chart(program_agg: pd.DataFrame):
+    """Create program engagement chart from the precomputed program aggregate"""
+    import plotly.graph_objects as go
+    program_data = program_agg.reset_index()
+
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
@@ -137,15 +334,11 @@ def create_program_engagement_chart(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
-def create_monthly_trend_chart(df: pd.DataFrame) -> go.Figure:
-    """Create monthly trend chart"""
-    df['Month'] = pd.to_datetime(df['Date']).dt.to_period('M')
-    monthly_data = df.groupby('Month').agg({
-        'Participants': 'sum',
-        'Satisfaction': 'mean'
-    }).reset_index()
-    monthly_data['Month'] = monthly_data['Month'].astype(str)
-    
+@st.cache_data(show_spinner=False)
+def create_monthly_trend_chart(monthly_data: pd.DataFrame):
+    """Create monthly trend chart from the precomputed monthly aggregate"""
+    import plotly.express as px
+
     fig = px.line(
         monthly_data,
         x='Month',
@@ -162,10 +355,21 @@ def create_monthly_trend_chart(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
-def create_category_breakdown(df: pd.DataFrame) -> go.Figure:
-    """Create category breakdown pie chart"""
-    category_counts = df['Category'].value_counts()
-    
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH_FUNCS)
+def _df_to_csv(df: pd.DataFrame) -> bytes:
+    """
+    Cached CSV serialization for the download button, keyed on the cheap
+    content-based frame hash so the bytes track whatever is actually shown,
+    including after the underlying data file changes.
+    """
+    return df.to_csv(index=False).encode('utf-8')
+
+
+@st.cache_data(show_spinner=False)
+def create_category_breakdown(category_counts: pd.Series):
+    """Create category breakdown pie chart from precomputed counts"""
+    import plotly.graph_objects as go
+
     fig = go.Figure(data=[go.Pie(
         labels=category_counts.index,
         values=category_counts.values,
@@ -184,20 +388,260 @@ def create_category_breakdown(df: pd.DataFrame) -> go.Figure:
 # STREAMLIT UI RENDERER
 # ============================================================================
 
+@st.fragment
+def _dashboard_tab(df: pd.DataFrame):
+    """Dashboard tab body: metrics row, highlights and overview charts"""
+    aggs = compute_aggregates(df)
+    metrics = aggs['metrics']
+
+    # Metrics row
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric(
+            label="📊 Total Responses",
+            value=f"{metrics['total_responses']:,}",
+            delta="responses collected"
+        )
+
+    with col2:
+        st.metric(
+            label="👥 Total Participants",
+            value=f"{metrics['total_participants']:,}",
+            delta="people engaged"
+        )
+
+    with col3:
+        satisfaction_pct = (metrics['avg_satisfaction'] / 5) * 100
+        st.metric(
+            label="😊 Avg Satisfaction",
+            value=f"{satisfaction_pct:.1f}%",
+            delta=f"{metrics['avg_satisfaction']:.2f}/5.0"
+        )
+
+    with col4:
+        st.metric(
+            label="✓ Attendance Rate",
+            value=f"{metrics['avg_attendance']:.1f}%",
+            delta="average"
+        )
+
+    st.markdown("---")
+
+    # Key highlights
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.info(f"🎯 **Top Program:** {metrics['top_program']}")
+
+    with col2:
+        st.info(f"📌 **Top Category:** {metrics['top_category']}")
+
+    st.markdown("---")
+
+    # Charts
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.plotly_chart(create_satisfaction_chart(aggs['sat_counts']), use_container_width=True)
+
+    with col2:
+        st.plotly_chart(create_category_breakdown(aggs['category_counts']), use_container_width=True)
+
+    st.plotly_chart(create_program_engagement_chart(aggs['program_agg']), use_container_width=True)
+    st.plotly_chart(create_monthly_trend_chart(aggs['monthly']), use_container_width=True)
+
+
+@st.fragment
+def _analytics_tab(df: pd.DataFrame):
+    """Analytics tab body: performance rankings and trend analysis"""
+    import plotly.express as px
+    st.subheader("📈 Deep Analytics")
+
+    aggs = compute_aggregates(df)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("#### Program Performance Ranking")
+        program_performance = aggs['program_agg'].sort_values('Participants', ascending=False)
+
+        st.dataframe(
+            program_performance.round(2),
+            use_container_width=True,
+            column_config={
+                "Participants": st.column_config.NumberColumn("Participants"),
+                "Satisfaction": st.column_config.NumberColumn("Avg Satisfaction", format="%.2f"),
+                "Attendance_Rate": st.column_config.NumberColumn("Attendance Rate", format="%.2%"),
+            }
+        )
+
+    with col2:
+        st.markdown("#### Category Performance")
+        category_performance = aggs['category_agg'].sort_values('Satisfaction', ascending=False)
+
+        st.dataframe(
+            category_performance.round(2),
+            use_container_width=True,
+        )
+
+    st.markdown("---")
+
+    # Time-based analysis
+    st.markdown("#### Trend Analysis")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        weekly_stats = aggs['weekly']
+
+        fig = px.area(
+            weekly_stats,
+            x='Week',
+            y='Participants',
+            title='Weekly Participation Trend',
+            markers=True
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        satisfaction_by_program = aggs['program_agg']['Satisfaction'].sort_values(ascending=True)
+        fig = px.bar(
+            x=satisfaction_by_program.values,
+            y=satisfaction_by_program.index,
+            orientation='h',
+            title='Satisfaction by Program',
+            labels={'x': 'Avg Satisfaction', 'y': 'Program'}
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+
+@st.fragment
+def _raw_data_tab(df: pd.DataFrame, selected_center: str):
+    """Raw Data tab body: filters, table view and CSV export"""
+    st.subheader("📋 Raw Data View")
+
+    # Filters
+    col1, col2, col3 = st.columns(3)
+
+    # .cat.categories is already unique -- no scan, unlike .unique()
+    program_options = list(df['Program'].cat.categories)
+    category_options = list(df['Category'].cat.categories)
+
+    with col1:
+        program_filter = st.multiselect(
+            "Filter by Program",
+            program_options,
+            default=program_options
+        )
+
+    with col2:
+        category_filter = st.multiselect(
+            "Filter by Category",
+            category_options,
+            default=category_options
+        )
+
+    with col3:
+        satisfaction_filter = st.slider(
+            "Min Satisfaction",
+            1, 5, 1
+        )
+
+    # Apply filters as one boolean mask ANDed in place over the category
+    # codes, instead of allocating three temporary boolean Series
+    prog_codes = df['Program'].cat.categories.get_indexer(program_filter)
+    cat_codes = df['Category'].cat.categories.get_indexer(category_filter)
+    mask = np.isin(df['Program'].cat.codes.to_numpy(), prog_codes)
+    mask &= np.isin(df['Category'].cat.codes.to_numpy(), cat_codes)
+    mask &= df['Satisfaction'].to_numpy() >= satisfaction_filter
+    filtered_df = df[mask]
+
+    # Bound what is sorted and shipped to the browser: nlargest is
+    # O(N log k) vs a full sort, and only page_size rows cross the wire
+    page_size = st.number_input("Rows to show", min_value=50, max_value=2000, value=200, step=50)
+
+    st.dataframe(
+        filtered_df.nlargest(page_size, 'Date'),
+        use_container_width=True,
+        height=400
+    )
+
+    # Download button; the cached serializer only reruns when the filter
+    # result actually changes, not on every rerun of the tab
+    st.download_button(
+        label="📥 Download Filtered Data (CSV)",
+        data=_df_to_csv(filtered_df),
+        file_name=f"{selected_center}_data.csv",
+        mime="text/csv"
+    )
+
+
+@st.fragment
+def _upload_tab(selected_center: str):
+    """Upload tab body: Excel uploader with preview and confirm"""
+    st.subheader("💾 Upload Center Data")
+
+    st.markdown("""
+    Upload Excel files for center data. Expected columns:
+    - **Date** - Activity date
+    - **Program** - Program name
+    - **Participants** - Number of participants
+    - **Satisfaction** - Satisfaction rating (1-5)
+    - **Category** - Feedback category
+    - **Attendance_Rate** - Attendance percentage (0-1)
+    - **Feedback_Score** - Feedback score (1-10)
+    - **Notes** - Additional notes
+    """)
+
+    uploaded_file = st.file_uploader(
+        "Choose Excel file",
+        type=["xlsx", "xls"],
+        key="data_upload"
+    )
+
+    if uploaded_file:
+        try:
+            df_upload = pd.read_excel(uploaded_file)
+            st.success(f"✅ File preview (first 10 rows) - Total rows: {len(df_upload)}")
+            st.dataframe(df_upload.head(10), use_container_width=True)
+
+            # Summary stats
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Total Records", len(df_upload))
+            with col2:
+                st.metric("Total Participants", df_upload['Participants'].sum())
+            with col3:
+                if 'Satisfaction' in df_upload.columns:
+                    st.metric("Avg Satisfaction", f"{df_upload['Satisfaction'].mean():.2f}/5")
+
+            if st.button("✅ Confirm & Load"):
+                st.session_state.uploaded_center_data = df_upload
+                # Persist as Parquet so later runs skip the xlsx parser
+                os.makedirs("data/center_data", exist_ok=True)
+                parquet_path = _upload_parquet_path(selected_center)
+                df_upload.to_parquet(parquet_path, compression='zstd')
+                st.success(f"Data loaded and saved to {parquet_path}!")
+
+        except Exception as e:
+            st.error(f"❌ Error: {str(e)}")
+
+
 def render_center_database():
     """Render the complete Center Database dashboard"""
-    
+
     # Title
     st.markdown('<div class="main-header">🏛️ Center Database Dashboard</div>', unsafe_allow_html=True)
-    
+
     # Create tabs
     tab1, tab2, tab3, tab4 = st.tabs(["📊 Dashboard", "📈 Analytics", "📋 Raw Data", "💾 Upload"])
-    
+
     # ========== TAB 1: DASHBOARD ==========
     with tab1:
-        # Center selection
+        # Center selection stays outside the fragments: changing it must
+        # refresh every tab, while widgets inside a tab only rerun that tab.
         col_select, col_period = st.columns([2, 1])
-        
+
         with col_select:
             centers = ["Aboubakr", "Al-Rashid", "Al-Noor", "Masjid Al-Hana", "Islamic Center"]
             selected_center = st.selectbox(
@@ -205,243 +649,36 @@ def render_center_database():
                 centers,
                 key="center_selector"
             )
-        
+
         with col_period:
             period = st.selectbox(
                 "📅 Time Period",
                 ["All Time", "Last 12 Months", "Last 6 Months", "Last 3 Months"],
                 key="period_selector"
             )
-        
-        st.markdown("---")
-        
-        # Load data
-        df = load_center_data(selected_center)
-        metrics = calculate_metrics(df)
-        
-        # Metrics row
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric(
-                label="📊 Total Responses",
-                value=f"{metrics['total_responses']:,}",
-                delta="responses collected"
-            )
-        
-        with col2:
-            st.metric(
-                label="👥 Total Participants",
-                value=f"{metrics['total_participants']:,}",
-                delta="people engaged"
-            )
-        
-        with col3:
-            satisfaction_pct = (metrics['avg_satisfaction'] / 5) * 100
-            st.metric(
-                label="😊 Avg Satisfaction",
-                value=f"{satisfaction_pct:.1f}%",
-                delta=f"{metrics['avg_satisfaction']:.2f}/5.0"
-            )
-        
-        with col4:
-            st.metric(
-                label="✓ Attendance Rate",
-                value=f"{metrics['avg_attendance']:.1f}%",
-                delta="average"
-            )
-        
-        st.markdown("---")
-        
-        # Key highlights
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.info(f"🎯 **Top Program:** {metrics['top_program']}")
-        
-        with col2:
-            st.info(f"📌 **Top Category:** {metrics['top_category']}")
-        
+
         st.markdown("---")
-        
-        # Charts
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.plotly_chart(create_satisfaction_chart(df), use_container_width=True)
-        
-        with col2:
-            st.plotly_chart(create_category_breakdown(df), use_container_width=True)
-        
-        st.plotly_chart(create_program_engagement_chart(df), use_container_width=True)
-        st.plotly_chart(create_monthly_trend_chart(df), use_container_width=True)
-    
+
+        # Load data once per centre switch; reruns for the same centre read
+        # the session copy and skip even the cache-key hashing
+        if st.session_state.get('df_center') != selected_center:
+            st.session_state.df = load_center_data(selected_center)
+            st.session_state.df_center = selected_center
+        df = st.session_state.df
+
+        _dashboard_tab(df)
+
     # ========== TAB 2: ANALYTICS ==========
     with tab2:
-        st.subheader("📈 Deep Analytics")
-        
-        df = load_center_data(selected_center)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("#### Program Performance Ranking")
-            program_performance = df.groupby('Program').agg({
-                'Participants': 'sum',
-                'Satisfaction': 'mean',
-                'Attendance_Rate': 'mean'
-            }).sort_values('Participants', ascending=False)
-            
-            st.dataframe(
-                program_performance.round(2),
-                use_container_width=True,
-                column_config={
-                    "Participants": st.column_config.NumberColumn("Participants"),
-                    "Satisfaction": st.column_config.NumberColumn("Avg Satisfaction", format="%.2f"),
-                    "Attendance_Rate": st.column_config.NumberColumn("Attendance Rate", format="%.2%"),
-                }
-            )
-        
-        with col2:
-            st.markdown("#### Category Performance")
-            category_performance = df.groupby('Category').agg({
-                'Satisfaction': 'mean',
-                'Feedback_Score': 'mean'
-            }).sort_values('Satisfaction', ascending=False)
-            
-            st.dataframe(
-                category_performance.round(2),
-                use_container_width=True,
-            )
-        
-        st.markdown("---")
-        
-        # Time-based analysis
-        st.markdown("#### Trend Analysis")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            df_copy = df.copy()
-            df_copy['Week'] = pd.to_datetime(df_copy['Date']).dt.to_period('W')
-            weekly_stats = df_copy.groupby('Week').agg({
-                'Participants': 'sum',
-                'Satisfaction': 'mean'
-            }).reset_index()
-            weekly_stats['Week'] = weekly_stats['Week'].astype(str)
-            
-            fig = px.area(
-                weekly_stats,
-                x='Week',
-                y='Participants',
-                title='Weekly Participation Trend',
-                markers=True
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            satisfaction_by_program = df.groupby('Program')['Satisfaction'].mean().sort_values(ascending=True)
-            fig = px.barh(
-                satisfaction_by_program,
-                title='Satisfaction by Program',
-                labels={'value': 'Avg Satisfaction', 'index': 'Program'}
-            )
-            st.plotly_chart(fig, use_container_width=True)
-    
+        _analytics_tab(df)
+
     # ========== TAB 3: RAW DATA ==========
     with tab3:
-        st.subheader("📋 Raw Data View")
-        
-        df = load_center_data(selected_center)
-        
-        # Filters
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            program_filter = st.multiselect(
-                "Filter by Program",
-                df['Program'].unique(),
-                default=df['Program'].unique()
-            )
-        
-        with col2:
-            category_filter = st.multiselect(
-                "Filter by Category",
-                df['Category'].unique(),
-                default=df['Category'].unique()
-            )
-        
-        with col3:
-            satisfaction_filter = st.slider(
-                "Min Satisfaction",
-                1, 5, 1
-            )
-        
-        # Apply filters
-        filtered_df = df[
-            (df['Program'].isin(program_filter)) &
-            (df['Category'].isin(category_filter)) &
-            (df['Satisfaction'] >= satisfaction_filter)
-        ]
-        
-        st.dataframe(
-            filtered_df.sort_values('Date', ascending=False),
-            use_container_width=True,
-            height=400
-        )
-        
-        # Download button
-        csv = filtered_df.to_csv(index=False)
-        st.download_button(
-            label="📥 Download Filtered Data (CSV)",
-            data=csv,
-            file_name=f"{selected_center}_data.csv",
-            mime="text/csv"
-        )
-    
+        _raw_data_tab(df, selected_center)
+
     # ========== TAB 4: UPLOAD ==========
     with tab4:
-        st.subheader("💾 Upload Center Data")
-        
-        st.markdown("""
-        Upload Excel files for center data. Expected columns:
-        - **Date** - Activity date
-        - **Program** - Program name
-        - **Participants** - Number of participants
-        - **Satisfaction** - Satisfaction rating (1-5)
-        - **Category** - Feedback category
-        - **Attendance_Rate** - Attendance percentage (0-1)
-        - **Feedback_Score** - Feedback score (1-10)
-        - **Notes** - Additional notes
-        """)
-        
-        uploaded_file = st.file_uploader(
-            "Choose Excel file",
-            type=["xlsx", "xls"],
-            key="data_upload"
-        )
-        
-        if uploaded_file:
-            try:
-                df_upload = pd.read_excel(uploaded_file)
-                st.success(f"✅ File preview (first 10 rows) - Total rows: {len(df_upload)}")
-                st.dataframe(df_upload.head(10), use_container_width=True)
-                
-                # Summary stats
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Total Records", len(df_upload))
-                with col2:
-                    st.metric("Total Participants", df_upload['Participants'].sum())
-                with col3:
-                    if 'Satisfaction' in df_upload.columns:
-                        st.metric("Avg Satisfaction", f"{df_upload['Satisfaction'].mean():.2f}/5")
-                
-                if st.button("✅ Confirm & Load"):
-                    st.session_state.uploaded_center_data = df_upload
-                    st.success("Data loaded successfully!")
-            
-            except Exception as e:
-                st.error(f"❌ Error: {str(e)}")
+        _upload_tab(selected_center)
 
 
 # ============================================================================